@@ -20,6 +20,7 @@ import {
     Legend,
     ComposedChart,
 } from "recharts";
+import { pollIntervalMs } from '../utils/constants';
 
 interface MetricCard {
     title: string;
@@ -111,7 +112,7 @@ const NetworkDashboard: React.FC = () => {
 
     const { data: stats, loading: isStatsLoading } = useQuery(GET_STATS, {
         variables: { hours: timeRange.value, divisions: timeRange.divisions },
-        pollInterval: 3000,
+        pollInterval: pollIntervalMs(3000),
     });
 
     const getValue = useCallback(
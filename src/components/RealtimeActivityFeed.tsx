@@ -5,7 +5,7 @@ import { formatDistanceToNow } from 'date-fns';
 import { Activity, Clock, Zap, Database, TrendingUp } from 'lucide-react';
 import { useQuery } from '@apollo/client';
 import { GET_LATEST_BLOCKS, GET_LATEST_TRANSFERS, GET_LATEST_DEPLOYMENTS } from '../graphql/queries';
-import { CURRENT_TOKEN } from '../utils/constants';
+import { CURRENT_TOKEN, pollIntervalMs } from '../utils/constants';
 
 interface ActivityItem {
   id: string;
@@ -38,17 +38,17 @@ const RealtimeActivityFeed: React.FC<RealtimeActivityFeedProps> = ({
   // Fetch real-time data using GraphQL queries with polling
   const { data: blocksData } = useQuery(GET_LATEST_BLOCKS, {
     variables: { limit: 5 },
-    pollInterval: 3000, // Poll every 3 seconds
+    pollInterval: pollIntervalMs(3000), // Poll every 3 seconds
   });
   
   const { data: transfersData } = useQuery(GET_LATEST_TRANSFERS, {
     variables: { limit: 5 },
-    pollInterval: 3000,
+    pollInterval: pollIntervalMs(3000),
   });
   
   const { data: deploymentsData } = useQuery(GET_LATEST_DEPLOYMENTS, {
     variables: { limit: 5 },
-    pollInterval: 3000,
+    pollInterval: pollIntervalMs(3000),
   });
   
   const blocks = blocksData?.blocks || [];
@@ -26,7 +26,7 @@ import { formatDistanceToNow, format } from 'date-fns';
 import { toast } from 'react-toastify';
 import { Transfer, Deployment, Block } from '../types';
 import { gql } from '@apollo/client';
-import { CURRENT_TOKEN } from '../utils/constants';
+import { CURRENT_TOKEN, pollIntervalMs } from '../utils/constants';
 
 // Enhanced GraphQL queries for transaction tracking
 const GET_RECENT_TRANSACTIONS = gql`
@@ -292,7 +292,7 @@ const TransactionTracker: React.FC<TransactionTrackerProps> = ({
   // Initial data query
   const { data: initialData, loading: initialLoading } = useQuery(GET_RECENT_TRANSACTIONS, {
     variables: { limit: 20 },
-    pollInterval: 5000 // Poll every 5 seconds
+    pollInterval: pollIntervalMs(5000) // Poll every 5 seconds
   });
 
   // Lazy queries for search and tracking
@@ -313,7 +313,7 @@ const TransactionTracker: React.FC<TransactionTrackerProps> = ({
         }
       })()
     },
-    pollInterval: 30000 // Poll every 30 seconds
+    pollInterval: pollIntervalMs(30000) // Poll every 30 seconds
   });
 
   // Process search results or initial data
@@ -16,7 +16,7 @@ import {
   XCircle,
 } from 'lucide-react';
 import { formatDistanceToNow } from 'date-fns';
-import { CURRENT_TOKEN } from '../utils/constants';
+import { CURRENT_TOKEN, pollIntervalMs } from '../utils/constants';
 import RecentDataExporter, { ExportEntities } from "./RecentDataExporter";
 
 // GraphQL Queries
@@ -143,7 +143,7 @@ const TransactionTrackerImproved: React.FC<TransactionTrackerImprovedProps> = ({
 
     // Fetch total counts
     const { data: countsData } = useQuery(GET_TRANSACTION_COUNTS, {
-        pollInterval: 30000, // Update counts every 30 seconds
+        pollInterval: pollIntervalMs(30000), // Update counts every 30 seconds
     });
     
     const [
@@ -192,7 +192,7 @@ const TransactionTrackerImproved: React.FC<TransactionTrackerImprovedProps> = ({
             transferLimit,
             transferOffset,
         },
-        pollInterval: embedded ? 0 : 10000, // Poll every 10 seconds if not embedded
+        pollInterval: embedded ? 0 : pollIntervalMs(10000), // Poll every 10 seconds if not embedded
     });
 
     const debouncedSearch = (value: string | number) => {      
@@ -96,6 +96,26 @@ export const GET_LATEST_BLOCKS = gql`
   }
 `;
 
+// Keyset pagination for the blocks list: fetch the page strictly below a
+// block-number cursor so loading page N costs the same as loading page 1,
+// instead of re-shipping everything above it with a growing limit/offset
+export const GET_BLOCKS_BEFORE = gql`
+  ${BLOCK_FRAGMENT}
+  ${DEPLOYMENT_FRAGMENT}
+  query GetBlocksBefore($beforeBlock: bigint!, $limit: Int = 20) {
+    blocks(
+      limit: $limit
+      order_by: { block_number: desc }
+      where: { block_number: { _lt: $beforeBlock } }
+    ) {
+      ...BlockFragment
+      deployments {
+        ...DeploymentFragment
+      }
+    }
+  }
+`;
+
 export const SEARCH_BLOCKS_BY_HASH = gql`
   ${BLOCK_FRAGMENT}
   query SearchBlocksByHash($search: String!, $limit: Int = 10, $offset: Int = 0) {
@@ -231,9 +251,9 @@ export const GET_ACTIVE_VALIDATORS = gql`
       stake
       block_number
     }
-    # Get recent blocks to count proposers client-side
+    # Get recent blocks to count proposers client-side; only the proposer
+    # column is needed for the reduction, so don't ship anything else
     blocks(limit: 1000, order_by: { block_number: desc }) {
-      block_number
       proposer
     }
   }
@@ -302,6 +322,26 @@ export const SUBSCRIBE_TO_NEW_TRANSFERS = gql`
   }
 `;
 
+// Live version of GetAllTransfers: Hasura pushes updates over the websocket
+// instead of the page re-fetching the full list on a poll timer
+export const SUBSCRIBE_TO_ALL_TRANSFERS = gql`
+  ${TRANSFER_FRAGMENT}
+  subscription SubscribeToAllTransfers($limit: Int = 50) {
+    transfers(
+      limit: $limit
+      order_by: { created_at: desc }
+    ) {
+      ...TransferFragment
+      deployment {
+        deploy_id
+        block_number
+        timestamp
+        errored
+      }
+    }
+  }
+`;
+
 export const SUBSCRIBE_TO_NETWORK_ACTIVITY = gql`
   subscription SubscribeToNetworkActivity {
     blocks(limit: 1, order_by: { block_number: desc }) {
@@ -405,6 +445,30 @@ export const GET_GENESIS_FUNDING_DEPLOYMENT = gql`
   }
 `;
 
+// Deployments related to a wallet address (used by WalletService)
+export const GET_RELATED_TRANSACTIONS = gql`
+  query GetRelatedTransactions($searchTerm: String!) {
+    deployments(
+      where: {
+        _or: [
+          { term: { _ilike: $searchTerm } }
+          { deployer: { _eq: $searchTerm } }
+        ]
+      }
+      order_by: { timestamp: desc }
+      limit: 10
+    ) {
+      deploy_id
+      deployer
+      block_number
+      timestamp
+      errored
+      error_message
+      deployment_type
+    }
+  }
+`;
+
 // Indexer Status Query
 export const GET_INDEXER_STATUS = gql`
   query GetIndexerStatus {
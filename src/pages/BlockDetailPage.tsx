@@ -6,6 +6,78 @@ import { Block } from '../types';
 import { formatDistanceToNow } from 'date-fns';
 import { CURRENT_TOKEN } from '../utils/constants';
 
+// Transfer terms look like: match ("from", "to", amount)
+// Compiled once at module load; extractTransferDetails runs per deployment row
+const TRANSFER_MATCH_PATTERN = /match\s*\(\s*"([^"]+)"\s*,\s*"([^"]+)"\s*,\s*(\d+)\s*\)/;
+
+const formatTimestamp = (timestamp: string | number) => {
+  try {
+    const ts = parseInt(timestamp.toString());
+    const date = new Date(ts);
+    if (isNaN(date.getTime())) return 'Invalid date';
+    return formatDistanceToNow(date, { addSuffix: true });
+  } catch (e) {
+    return 'Invalid date';
+  }
+};
+
+const formatDate = (timestamp: string | number) => {
+  try {
+    const ts = parseInt(timestamp.toString());
+    const date = new Date(ts);
+    if (isNaN(date.getTime())) return 'Invalid date';
+    return date.toLocaleString();
+  } catch (e) {
+    return 'Invalid date';
+  }
+};
+
+const truncateAddress = (address: string) => {
+  if (!address || address.length < 32) return address;
+  return `${address.slice(0, 20)}...${address.slice(-20)}`;
+};
+
+// Classify a deployment by scanning its term for known markers; checks are
+// ordered so the most common type is decided with the fewest scans
+const getTransactionType = (deploy: any) => {
+  if (deploy.deployment_type) {
+    return deploy.deployment_type;
+  }
+
+  if (deploy.term) {
+    if (deploy.term.includes('ASIVault') && deploy.term.includes('transfer')) {
+      return 'ASI Transfer';
+    } else if (deploy.term.includes('validator') || deploy.term.includes('bond')) {
+      return 'Validator Operation';
+    } else if (deploy.term.includes('ch_')) {
+      return 'Channel Operation';
+    }
+  }
+
+  return 'Contract Deployment';
+};
+
+// Try to extract transfer details from Rholang term
+const extractTransferDetails = (term: string) => {
+  // Fast substring pre-filter: skip the normalize + regex pass entirely
+  // for the common case of terms with no match clause
+  if (!term.includes('match')) {
+    return null;
+  }
+
+  const cleanTerm = term.replace(/\\n/g, ' ');
+  const match = cleanTerm.match(TRANSFER_MATCH_PATTERN);
+
+  if (match) {
+    return {
+      from: match[1],
+      to: match[2],
+      amount: parseInt(match[3]) / 1000000000
+    };
+  }
+  return null;
+};
+
 const BlockDetailPage: React.FC = () => {
   const { blockNumber } = useParams<{ blockNumber: string }>();
   
@@ -41,67 +113,6 @@ const BlockDetailPage: React.FC = () => {
     );
   }
 
-  const formatTimestamp = (timestamp: string | number) => {
-    try {
-      const ts = parseInt(timestamp.toString());
-      const date = new Date(ts);
-      if (isNaN(date.getTime())) return 'Invalid date';
-      return formatDistanceToNow(date, { addSuffix: true });
-    } catch (e) {
-      return 'Invalid date';
-    }
-  };
-
-  const formatDate = (timestamp: string | number) => {
-    try {
-      const ts = parseInt(timestamp.toString());
-      const date = new Date(ts);
-      if (isNaN(date.getTime())) return 'Invalid date';
-      return date.toLocaleString();
-    } catch (e) {
-      return 'Invalid date';
-    }
-  };
-
-  const truncateAddress = (address: string) => {
-    if (!address || address.length < 32) return address;
-    return `${address.slice(0, 20)}...${address.slice(-20)}`;
-  };
-
-  const getTransactionType = (deploy: any) => {
-    if (deploy.deployment_type) {
-      return deploy.deployment_type;
-    }
-    
-    if (deploy.term) {
-      if (deploy.term.includes('ASIVault') && deploy.term.includes('transfer')) {
-        return 'ASI Transfer';
-      } else if (deploy.term.includes('validator') || deploy.term.includes('bond')) {
-        return 'Validator Operation';
-      } else if (deploy.term.includes('ch_')) {
-        return 'Channel Operation';
-      }
-    }
-    
-    return 'Contract Deployment';
-  };
-
-  // Try to extract transfer details from Rholang term
-  const extractTransferDetails = (term: string) => {
-    const cleanTerm = term.replace(/\\n/g, ' ');
-    const matchPattern = /match\s*\(\s*"([^"]+)"\s*,\s*"([^"]+)"\s*,\s*(\d+)\s*\)/;
-    const match = cleanTerm.match(matchPattern);
-    
-    if (match) {
-      return {
-        from: match[1],
-        to: match[2],
-        amount: parseInt(match[3]) / 1000000000
-      };
-    }
-    return null;
-  };
-
   return (
     <>
       {/* Navigation */}
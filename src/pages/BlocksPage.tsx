@@ -1,6 +1,6 @@
 import React, { useState } from 'react';
 import { useQuery } from '@apollo/client';
-import { GET_LATEST_BLOCKS } from '../graphql/queries';
+import { GET_BLOCKS_BEFORE, GET_LATEST_BLOCKS } from '../graphql/queries';
 import { Block } from '../types';
 import BlockCard from '../components/BlockCard';
 import LoadingSpinner from '../components/LoadingSpinner';
@@ -8,12 +8,37 @@ import { ChevronLeft } from 'lucide-react';
 
 const BlocksPage: React.FC = () => {
   const [limit] = useState(20);
-  
+  // False once a page comes back smaller than the limit — there's nothing
+  // older left to fetch
+  const [hasMore, setHasMore] = useState(true);
+
   const { data, loading, error, fetchMore } = useQuery(GET_LATEST_BLOCKS, {
     variables: { limit },
     notifyOnNetworkStatusChange: true,
   });
 
+  const loadMore = (blocks: Block[]) => {
+    const oldest = blocks[blocks.length - 1];
+    if (!oldest) return;
+
+    // Keyset pagination: ask only for blocks below the oldest one we have,
+    // instead of re-fetching the whole list with a bigger limit
+    fetchMore({
+      query: GET_BLOCKS_BEFORE,
+      variables: { beforeBlock: oldest.block_number, limit },
+      updateQuery: (prev, { fetchMoreResult }) => {
+        const newBlocks = fetchMoreResult?.blocks || [];
+        if (newBlocks.length < limit) {
+          setHasMore(false);
+        }
+        if (newBlocks.length === 0) {
+          return prev;
+        }
+        return { ...prev, blocks: [...prev.blocks, ...newBlocks] };
+      },
+    });
+  };
+
   if (loading && !data) {
     return (
       <div className="flex items-center justify-center min-h-[400px]">
@@ -62,13 +87,11 @@ const BlocksPage: React.FC = () => {
       </div>
 
       {/* Pagination */}
-      {blocks.length >= limit && (
+      {blocks.length >= limit && hasMore && (
         <div className="flex items-center justify-center space-x-4 py-6">
-          <button 
+          <button
             className="btn-secondary flex items-center space-x-2"
-            onClick={() => fetchMore({
-              variables: { limit: limit + 20 }
-            })}
+            onClick={() => loadMore(blocks)}
             disabled={loading}
           >
             {loading ? (
@@ -3,6 +3,7 @@ import { useQuery } from '@apollo/client';
 import { Link } from 'react-router-dom';
 import { gql } from '@apollo/client';
 import { formatDistanceToNow } from 'date-fns';
+import { pollIntervalMs } from '../utils/constants';
 
 const GET_DEPLOYMENTS = gql`
   query GetDeployments($limit: Int!, $offset: Int!, $search: String) {
@@ -69,7 +70,7 @@ const DeploymentsPage: React.FC = () => {
       offset: (currentPage - 1) * deploymentsPerPage,
       search: searchQuery ? `%${searchQuery}%` : '%'
     },
-    pollInterval: 3000, // Poll every 3 seconds
+    pollInterval: pollIntervalMs(3000), // Poll every 3 seconds
   });
 
   const deployments: Deployment[] = queryData?.deployments || [];
@@ -12,6 +12,7 @@ import { formatDistanceToNow } from "date-fns";
 import { calculateAverageBlockTime } from "../utils/calculateBlockTime";
 import RealtimeActivityFeed from "../components/RealtimeActivityFeed";
 import RecentDataExporter, { ExportEntities } from "../components/RecentDataExporter";
+import { pollIntervalMs } from '../utils/constants';
 // import { useRealtimeBlocks, useRealtimeNetworkStats } from '../services/websocketService';
 
 // Query to get recent blocks for calculating average block time
@@ -33,13 +34,13 @@ const HomePage: React.FC = () => {
     const { data: statsData, loading: statsLoading } = useQuery(
         GET_NETWORK_STATS,
         {
-            pollInterval: 3000, // Poll every 3 seconds
+            pollInterval: pollIntervalMs(3000), // Poll every 3 seconds
         }
     );
 
     // Get recent blocks for calculating average block time
     const { data: blocksData } = useQuery(GET_RECENT_BLOCKS, {
-        pollInterval: 5000, // Poll every 5 seconds
+        pollInterval: pollIntervalMs(5000), // Poll every 5 seconds
     });
 
     // Get paginated blocks with polling - use search query if present
@@ -76,7 +77,7 @@ const HomePage: React.FC = () => {
         queryToUse,
         {
             variables: queryVariables,
-            pollInterval: isSearching ? 0 : 2000, // Don't poll when searching
+            pollInterval: isSearching ? 0 : pollIntervalMs(2000), // Don't poll when searching
             skip: isSearching && !searchTerm, // Skip query if searching but no term
         }
     );
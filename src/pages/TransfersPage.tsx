@@ -1,24 +1,68 @@
 import React, { useState, useMemo } from 'react';
-import { useQuery } from '@apollo/client';
+import { useSubscription } from '@apollo/client';
 import { Link } from 'react-router-dom';
-import { GET_ALL_TRANSFERS } from '../graphql/queries';
+import { SUBSCRIBE_TO_ALL_TRANSFERS } from '../graphql/queries';
 import { Transfer, GenesisFunding } from '../types';
 import { formatDistanceToNow } from 'date-fns';
 import { useGenesisFunding } from '../hooks/useGenesisFunding';
 import { formatGenesisFunding } from '../utils/parseGenesisFunding';
 import { CURRENT_TOKEN } from '../utils/constants';
 
+// Display helpers are hoisted to module scope so the 2s polling render
+// doesn't rebuild the closures on every pass
+
+const formatTimestamp = (timestamp: string | number) => {
+    try {
+        // Convert to number if string
+        const ts = typeof timestamp === 'string' ? parseInt(timestamp) : timestamp;
+        // If timestamp looks like milliseconds (very large number), use directly
+        // Otherwise multiply by 1000 to convert seconds to milliseconds
+        const date = new Date(ts > 1e10 ? ts : ts * 1000);
+        if (isNaN(date.getTime())) return 'Invalid date';
+        return formatDistanceToNow(date, { addSuffix: true });
+    } catch (e) {
+        return 'Invalid date';
+    }
+};
+
+const formatAsiAmount = (amount: number | string) => {
+    const numAmount = parseFloat(amount.toString());
+    if (isNaN(numAmount)) return '0';
+
+    // If it's a whole number, show no decimals
+    if (numAmount % 1 === 0) {
+        return numAmount.toString();
+    }
+    // If it's >= 1, show up to 4 decimal places, removing trailing zeros
+    else if (numAmount >= 1) {
+        return parseFloat(numAmount.toFixed(4)).toString();
+    }
+    // If it's < 1, show up to 6 decimal places, removing trailing zeros
+    else if (numAmount >= 0.000001) {
+        return parseFloat(numAmount.toFixed(6)).toString();
+    }
+    // For very small amounts, use scientific notation
+    else {
+        return numAmount.toExponential(3);
+    }
+};
+
+const truncateDeployId = (deployId: string) =>
+    deployId.length > 40
+        ? `${deployId.slice(0, 20)}...${deployId.slice(-20)}`
+        : deployId;
+
 const TransfersPage: React.FC = () => {
     const [currentPage, setCurrentPage] = useState(1);
     const transfersPerPage = 10; // Changed to 10 to match old explorer
 
-    // Get ALL transfers (not paginated) to merge with genesis funding
-    const { data: queryData, loading: transfersLoading, error: transfersError } = useQuery(GET_ALL_TRANSFERS, {
+    // Get ALL transfers (not paginated) to merge with genesis funding.
+    // Subscribing lets Hasura push changes instead of this page re-fetching
+    // the full list every 2 seconds on a poll timer.
+    const { data: queryData, loading: transfersLoading, error: transfersError } = useSubscription(SUBSCRIBE_TO_ALL_TRANSFERS, {
         variables: {
             limit: 1000, // Get all transfers to merge with genesis funding
-            offset: 0
         },
-        pollInterval: 2000, // Poll every 2 seconds
     });
 
     // Get genesis funding events
@@ -94,42 +138,6 @@ const TransfersPage: React.FC = () => {
         }
     };
 
-    const formatTimestamp = (timestamp: string | number) => {
-        try {
-            // Convert to number if string
-            const ts = typeof timestamp === 'string' ? parseInt(timestamp) : timestamp;
-            // If timestamp looks like milliseconds (very large number), use directly
-            // Otherwise multiply by 1000 to convert seconds to milliseconds
-            const date = new Date(ts > 1e10 ? ts : ts * 1000);
-            if (isNaN(date.getTime())) return 'Invalid date';
-            return formatDistanceToNow(date, { addSuffix: true });
-        } catch (e) {
-            return 'Invalid date';
-        }
-    };
-
-    const formatAsiAmount = (amount: number | string) => {
-        const numAmount = parseFloat(amount.toString());
-        if (isNaN(numAmount)) return '0';
-
-        // If it's a whole number, show no decimals
-        if (numAmount % 1 === 0) {
-            return numAmount.toString();
-        }
-        // If it's >= 1, show up to 4 decimal places, removing trailing zeros
-        else if (numAmount >= 1) {
-            return parseFloat(numAmount.toFixed(4)).toString();
-        }
-        // If it's < 1, show up to 6 decimal places, removing trailing zeros
-        else if (numAmount >= 0.000001) {
-            return parseFloat(numAmount.toFixed(6)).toString();
-        }
-        // For very small amounts, use scientific notation
-        else {
-            return numAmount.toExponential(3);
-        }
-    };
-
     return (
         <section className="asi-card">
             <div className="section-header">
@@ -324,10 +332,7 @@ const TransfersPage: React.FC = () => {
                                                     Deploy ID
                                                 </dt>
                                                 <dd className="mono" style={{ fontSize: '11px', margin: 0, wordBreak: 'break-all' }}>
-                                                    {transfer.deploy_id.length > 40
-                                                        ? `${transfer.deploy_id.slice(0, 20)}...${transfer.deploy_id.slice(-20)}`
-                                                        : transfer.deploy_id
-                                                    }
+                                                    {truncateDeployId(transfer.deploy_id)}
                                                 </dd>
                                             </>
                                         )}
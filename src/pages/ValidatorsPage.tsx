@@ -1,184 +1,188 @@
-import React from 'react';
+import React, { useEffect, useMemo } from 'react';
 import { useQuery } from '@apollo/client';
 import { GET_ACTIVE_VALIDATORS } from '../graphql/queries';
 import { Validator } from '../types';
-import { CURRENT_TOKEN } from '../utils/constants';
+import { CURRENT_TOKEN, pollIntervalMs } from '../utils/constants';
 import { fromCogs } from '../utils/calculateBlockTime';
 
+// Function to normalize validator keys for comparison
+// We need to extract just the first 8 and last 8 chars for comparison
+const normalizeValidatorKey = (key: string): string => {
+  if (!key) return '';
+
+  // If it's an abbreviated key (contains ellipsis like "04837a4c...b2df065f")
+  if (key.includes('...')) {
+    const parts = key.split('...');
+    if (parts.length === 2) {
+      // Extract first 8 and last 8 chars from abbreviated format
+      return `${parts[0]}${parts[1]}`;
+    }
+  }
+
+  // If it's a full key (64+ chars), extract first 8 and last 8
+  if (key.length >= 64) {
+    return `${key.slice(0, 8)}${key.slice(-8)}`;
+  }
+
+  // Return as-is if neither format matches
+  return key;
+};
+
+// Calculate proper stake amounts with better formatting
+const calculateStake = (stake: number | string): string => {
+  const stakeNum = typeof stake === 'string' ? parseFloat(stake) : stake;
+  if (!stakeNum || stakeNum === 0 || isNaN(stakeNum)) return '0.00';
+  // Stake values from API appear to already be in ASI
+  const revAmount = fromCogs(stakeNum); // convert to the readable format using decimals multiplier
+
+  // Format based on size
+  if (revAmount >= 1000000) {
+    return (revAmount / 1000000).toFixed(2) + 'M';
+  } else if (revAmount >= 1000) {
+    return (revAmount / 1000).toFixed(2) + 'K';
+  } else if (revAmount < 0.01) {
+    return revAmount.toExponential(2);
+  } else {
+    return revAmount.toFixed(2);
+  }
+};
+
+// Calculate raw stake for display without formatting
+const calculateRawStake = (stake: number | string): number => {
+  const stakeNum = typeof stake === 'string' ? parseFloat(stake) : stake;
+  if (!stakeNum || stakeNum === 0 || isNaN(stakeNum)) return 0;
+  // Stake values from API appear to already be in ASI
+  return stakeNum;
+};
+
+// Resolve the stake for a validator from its latest bond, falling back to total_stake
+const resolveStake = (
+  validator: Validator,
+  bondsByValidator: { [key: string]: any },
+  bondsByNormalizedKey: { [key: string]: any }
+): number => {
+  const normalizedKey = normalizeValidatorKey(validator.public_key);
+  const latestBond = bondsByValidator[validator.public_key] || bondsByNormalizedKey[normalizedKey];
+  let stake = 0;
+
+  if (latestBond?.stake !== undefined && latestBond?.stake !== null) {
+    // Handle both string and number types
+    stake = typeof latestBond.stake === 'string' ? parseFloat(latestBond.stake) : latestBond.stake;
+  } else if (validator.total_stake !== undefined && validator.total_stake !== null) {
+    // Handle both string and number types
+    stake = typeof validator.total_stake === 'string' ? parseFloat(validator.total_stake) : validator.total_stake;
+  }
+
+  return stake;
+};
+
+const truncateKey = (key: string) => {
+  if (!key || key.length < 32) return key;
+  return `${key.slice(0, 16)}...${key.slice(-16)}`;
+};
+
 const ValidatorsPage: React.FC = () => {
   const { data, loading, error } = useQuery(GET_ACTIVE_VALIDATORS, {
-    pollInterval: 5000, // Poll every 5 seconds
+    pollInterval: pollIntervalMs(5000), // Poll every 5 seconds
   });
 
   const rawValidators = data?.validators || [];
   const validatorBonds = data?.validator_bonds || [];
   const allBlocks = data?.blocks || [];
-  
-  // Function to normalize validator keys for comparison
-  // We need to extract just the first 8 and last 8 chars for comparison
-  const normalizeValidatorKey = (key: string): string => {
-    if (!key) return '';
-    
-    // If it's an abbreviated key (contains ellipsis like "04837a4c...b2df065f")
-    if (key.includes('...')) {
-      const parts = key.split('...');
-      if (parts.length === 2) {
-        // Extract first 8 and last 8 chars from abbreviated format
-        return `${parts[0]}${parts[1]}`;
-      }
-    }
-    
-    // If it's a full key (64+ chars), extract first 8 and last 8
-    if (key.length >= 64) {
-      return `${key.slice(0, 8)}${key.slice(-8)}`;
+
+  // Log once per distinct error instead of on every poll-driven render;
+  // the page re-renders every 5 seconds while an error persists
+  useEffect(() => {
+    if (error) {
+      console.error('ValidatorsPage error:', error);
     }
-    
-    // Return as-is if neither format matches
-    return key;
-  };
-  
-  // Deduplicate validators by normalized key prefix
-  const validatorMap = new Map<string, any>();
-  rawValidators.forEach((validator: any) => {
-    const normalizedKey = normalizeValidatorKey(validator.public_key);
-    const existing = validatorMap.get(normalizedKey);
-    
-    if (!existing) {
-      validatorMap.set(normalizedKey, validator);
-    } else {
-      // Prefer the entry with more complete data
-      // Keep the one with the full key if available
-      if (validator.public_key.length > existing.public_key.length) {
+  }, [error]);
+
+  // Deduplicate validators by normalized key prefix.
+  // Memoized on the query result so the 5s poll only pays for the
+  // reduction when Hasura actually returned new data.
+  const validators = useMemo(() => {
+    const validatorMap = new Map<string, any>();
+    rawValidators.forEach((validator: any) => {
+      const normalizedKey = normalizeValidatorKey(validator.public_key);
+      const existing = validatorMap.get(normalizedKey);
+
+      if (!existing) {
         validatorMap.set(normalizedKey, validator);
-      } else if (validator.public_key.length === existing.public_key.length) {
-        // If both have same key length, keep the one with higher stake or more recent activity
-        if ((validator.last_seen_block || 0) > (existing.last_seen_block || 0)) {
+      } else {
+        // Prefer the entry with more complete data
+        // Keep the one with the full key if available
+        if (validator.public_key.length > existing.public_key.length) {
           validatorMap.set(normalizedKey, validator);
+        } else if (validator.public_key.length === existing.public_key.length) {
+          // If both have same key length, keep the one with higher stake or more recent activity
+          if ((validator.last_seen_block || 0) > (existing.last_seen_block || 0)) {
+            validatorMap.set(normalizedKey, validator);
+          }
         }
       }
-    }
-  });
-  
-  const validators = Array.from(validatorMap.values());
-  
-  if (!loading) {
-    if (error) {
-      console.error('ValidatorsPage error:', error);
-    }
-  }
-  
+    });
+
+    return Array.from(validatorMap.values());
+  }, [rawValidators]);
+
   // Create a map of validator public key to their latest bond
   // Map both full and normalized keys to handle duplicates
-  const bondsByValidator: { [key: string]: any } = {};
-  const bondsByNormalizedKey: { [key: string]: any } = {};
-  
-  validatorBonds.forEach((bond: any) => {
-    const normalizedKey = normalizeValidatorKey(bond.validator_public_key);
-    
-    // Store by original key
-    const existingBond = bondsByValidator[bond.validator_public_key];
-    if (!existingBond || bond.block_number > existingBond.block_number) {
-      bondsByValidator[bond.validator_public_key] = bond;
-    }
-    
-    // Also store by normalized key for lookup
-    const existingNormalizedBond = bondsByNormalizedKey[normalizedKey];
-    if (!existingNormalizedBond || bond.block_number > existingNormalizedBond.block_number) {
-      bondsByNormalizedKey[normalizedKey] = bond;
-    }
-  });
-  
-  // Count blocks proposed by each validator
-  const blockProposedCounts: { [key: string]: number } = {};
-  allBlocks.forEach((block: { proposer: string }) => {
-    if (block.proposer) {
-      blockProposedCounts[block.proposer] = (blockProposedCounts[block.proposer] || 0) + 1;
-    }
-  });
-  
-  // Calculate proper stake amounts with better formatting
-  const calculateStake = (stake: number | string): string => {
-    const stakeNum = typeof stake === 'string' ? parseFloat(stake) : stake;
-    if (!stakeNum || stakeNum === 0 || isNaN(stakeNum)) return '0.00';
-    // Stake values from API appear to already be in ASI
-    const revAmount = fromCogs(stakeNum); // convert to the readable format using decimals multiplier
-    
-    // Format based on size
-    if (revAmount >= 1000000) {
-      return (revAmount / 1000000).toFixed(2) + 'M';
-    } else if (revAmount >= 1000) {
-      return (revAmount / 1000).toFixed(2) + 'K';
-    } else if (revAmount < 0.01) {
-      return revAmount.toExponential(2);
-    } else {
-      return revAmount.toFixed(2);
-    }
-  };
+  const { bondsByValidator, bondsByNormalizedKey } = useMemo(() => {
+    const byValidator: { [key: string]: any } = {};
+    const byNormalizedKey: { [key: string]: any } = {};
 
-  // Calculate raw stake for display without formatting
-  const calculateRawStake = (stake: number | string): number => {
-    const stakeNum = typeof stake === 'string' ? parseFloat(stake) : stake;
-    if (!stakeNum || stakeNum === 0 || isNaN(stakeNum)) return 0;
-    // Stake values from API appear to already be in ASI
-    return stakeNum;
-  };
+    validatorBonds.forEach((bond: any) => {
+      const normalizedKey = normalizeValidatorKey(bond.validator_public_key);
 
-  // Calculate total stake using the latest bond stake for each validator
-  const totalStake = validators.reduce((sum: number, validator: Validator) => {
-    // Try to find bond by both original key and normalized key
-    const normalizedKey = normalizeValidatorKey(validator.public_key);
-    const latestBond = bondsByValidator[validator.public_key] || bondsByNormalizedKey[normalizedKey];
-    let stake = 0;
-    
-    if (latestBond?.stake !== undefined && latestBond?.stake !== null) {
-      // Handle both string and number types
-      stake = typeof latestBond.stake === 'string' ? parseFloat(latestBond.stake) : latestBond.stake;
-    } else if (validator.total_stake !== undefined && validator.total_stake !== null) {
-      // Handle both string and number types
-      stake = typeof validator.total_stake === 'string' ? parseFloat(validator.total_stake) : validator.total_stake;
-    }
-    
-    // console.log(`Validator ${validator.public_key.substring(0,10)}... stake:`, stake, 'type:', typeof stake, 'source:', latestBond ? 'bond' : 'total_stake');
-    return sum + stake;
-  }, 0);
+      // Store by original key
+      const existingBond = byValidator[bond.validator_public_key];
+      if (!existingBond || bond.block_number > existingBond.block_number) {
+        byValidator[bond.validator_public_key] = bond;
+      }
 
-  // Debug logging (commented out for production)
-  // if (validators.length > 0 && !loading) {
-  //   console.log('=== Validator Stake Debug ===');
-  //   console.log('Number of validators:', validators.length);
-  //   console.log('Total stake raw:', totalStake);
-  //   console.log('Total stake ASI:', totalStake / 1e8);
-  //   console.log('Average stake ASI:', totalStake / 1e8 / validators.length);
-  // }
+      // Also store by normalized key for lookup
+      const existingNormalizedBond = byNormalizedKey[normalizedKey];
+      if (!existingNormalizedBond || bond.block_number > existingNormalizedBond.block_number) {
+        byNormalizedKey[normalizedKey] = bond;
+      }
+    });
 
-  // Sort validators by their stake (bond or total_stake)
-  const sortedValidators = [...validators].sort((a, b) => {
-    const aNormalizedKey = normalizeValidatorKey(a.public_key);
-    const bNormalizedKey = normalizeValidatorKey(b.public_key);
-    const aLatestBond = bondsByValidator[a.public_key] || bondsByNormalizedKey[aNormalizedKey];
-    const bLatestBond = bondsByValidator[b.public_key] || bondsByNormalizedKey[bNormalizedKey];
-    
-    let aStake = 0;
-    if (aLatestBond?.stake !== undefined && aLatestBond?.stake !== null) {
-      aStake = typeof aLatestBond.stake === 'string' ? parseFloat(aLatestBond.stake) : aLatestBond.stake;
-    } else if (a.total_stake !== undefined && a.total_stake !== null) {
-      aStake = typeof a.total_stake === 'string' ? parseFloat(a.total_stake) : a.total_stake;
-    }
-    
-    let bStake = 0;
-    if (bLatestBond?.stake !== undefined && bLatestBond?.stake !== null) {
-      bStake = typeof bLatestBond.stake === 'string' ? parseFloat(bLatestBond.stake) : bLatestBond.stake;
-    } else if (b.total_stake !== undefined && b.total_stake !== null) {
-      bStake = typeof b.total_stake === 'string' ? parseFloat(b.total_stake) : b.total_stake;
-    }
-    
-    return bStake - aStake;
-  });
+    return { bondsByValidator: byValidator, bondsByNormalizedKey: byNormalizedKey };
+  }, [validatorBonds]);
+
+  // Count blocks proposed by each validator
+  const blockProposedCounts = useMemo(() => {
+    const counts: { [key: string]: number } = {};
+    allBlocks.forEach((block: { proposer: string }) => {
+      if (block.proposer) {
+        counts[block.proposer] = (counts[block.proposer] || 0) + 1;
+      }
+    });
+    return counts;
+  }, [allBlocks]);
 
-  const truncateKey = (key: string) => {
-    if (!key || key.length < 32) return key;
-    return `${key.slice(0, 16)}...${key.slice(-16)}`;
-  };
+  // Calculate total stake using the latest bond stake for each validator
+  const totalStake = useMemo(
+    () =>
+      validators.reduce(
+        (sum: number, validator: Validator) =>
+          sum + resolveStake(validator, bondsByValidator, bondsByNormalizedKey),
+        0
+      ),
+    [validators, bondsByValidator, bondsByNormalizedKey]
+  );
+
+  // Sort validators by their stake (bond or total_stake)
+  const sortedValidators = useMemo(
+    () =>
+      [...validators].sort(
+        (a, b) =>
+          resolveStake(b, bondsByValidator, bondsByNormalizedKey) -
+          resolveStake(a, bondsByValidator, bondsByNormalizedKey)
+      ),
+    [validators, bondsByValidator, bondsByNormalizedKey]
+  );
 
   return (
     <section className="asi-card">
@@ -269,15 +273,10 @@ const ValidatorsPage: React.FC = () => {
                     const normalizedKey = normalizeValidatorKey(validator.public_key);
                     const latestBond = bondsByValidator[validator.public_key] || bondsByNormalizedKey[normalizedKey];
                     const blocksProposed = blockProposedCounts[validator.public_key] || 0;
-                    
+
                     // Use the same logic as total calculation
-                    let stake = 0;
-                    if (latestBond?.stake !== undefined && latestBond?.stake !== null) {
-                      stake = typeof latestBond.stake === 'string' ? parseFloat(latestBond.stake) : latestBond.stake;
-                    } else if (validator.total_stake !== undefined && validator.total_stake !== null) {
-                      stake = typeof validator.total_stake === 'string' ? parseFloat(validator.total_stake) : validator.total_stake;
-                    }
-                    
+                    const stake = resolveStake(validator, bondsByValidator, bondsByNormalizedKey);
+
                     const stakePercentage = totalStake > 0 ? (stake / totalStake * 100).toFixed(2) : '0.00';
                     
                     return (
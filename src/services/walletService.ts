@@ -1,3 +1,5 @@
+import apolloClient from "../apollo-client";
+import {GET_RELATED_TRANSACTIONS} from "../graphql/queries";
 import {CURRENT_TOKEN} from "../utils/constants";
 
 export interface WalletBalance {
@@ -26,7 +28,6 @@ export interface RChainExploreResponse {
  */
 export class WalletService {
     private static readonly RCHAIN_NODE_URL = process.env.NODE_ENV === 'development' ? '' : (process.env.REACT_APP_RCHAIN_NODE_URL || 'http://localhost:40453');
-    private static readonly GRAPHQL_URL = process.env.REACT_APP_GRAPHQL_URL || 'http://localhost:8080/v1/graphql';
     private static readonly EXPLORE_ENDPOINT = '/api/explore-deploy';
     private static readonly ASI_DUST_RATIO = 100_000_000; // 1 ASI = 100,000,000 dust
     private static readonly REQUEST_TIMEOUT = 30000; // 30 seconds
@@ -158,48 +159,16 @@ export class WalletService {
      */
     private static async getRelatedTransactions(address: string): Promise<any[]> {
         try {
-            // Query the GraphQL endpoint for deployments containing this address
-            const query = `
-        query GetRelatedTransactions($searchTerm: String!) {
-          deployments(
-            where: {
-              _or: [
-                { term: { _ilike: $searchTerm } },
-                { deployer: { _eq: $searchTerm } }
-              ]
-            }
-            order_by: { timestamp: desc }
-            limit: 10
-          ) {
-            deploy_id
-            deployer
-            block_number
-            timestamp
-            errored
-            error_message
-            deployment_type
-          }
-        }
-      `;
-
-            const response = await fetch(WalletService.GRAPHQL_URL, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                    'X-Hasura-Admin-Secret': 'myadminsecretkey',
+            // Query the GraphQL endpoint through the shared Apollo client so
+            // auth headers and the underlying connection are reused
+            const result = await apolloClient.query({
+                query: GET_RELATED_TRANSACTIONS,
+                variables: {
+                    searchTerm: `%${address}%`,
                 },
-                body: JSON.stringify({
-                    query,
-                    variables: {
-                        searchTerm: `%${address}%`,
-                    },
-                }),
             });
 
-            if (response.ok) {
-                const result = await response.json();
-                return result.data?.deployments || [];
-            }
+            return result.data?.deployments || [];
         } catch (error) {
             console.warn('Could not fetch related transactions:', error);
         }
@@ -221,16 +190,17 @@ export class WalletService {
             // Generate Rholang query
             const rholangCode = this.generateBalanceQuery(address);
 
-            // Query RChain node
-            const response = await this.queryRChainNode(rholangCode);
+            // The node balance query and the indexer transaction lookup are
+            // independent, so run them concurrently instead of back-to-back
+            const [response, transactions] = await Promise.all([
+                this.queryRChainNode(rholangCode),
+                this.getRelatedTransactions(address),
+            ]);
 
             // Parse balance response
             const balanceDust = this.parseBalanceResponse(response);
             const balanceAsi = this.dustToAsi(balanceDust);
 
-            // Get related transactions (async, don't block on failure)
-            const transactions = await this.getRelatedTransactions(address);
-
             // Prepare result
             const result: WalletBalance = {
                 address,
@@ -28,6 +28,7 @@ class WebSocketService {
   private reconnectAttempts = 0;
   private maxReconnectAttempts = 5;
   private reconnectDelay = 1000; // Start with 1 second
+  private maxReconnectDelay = 10000; // Cap the exponential backoff at 10 seconds
 
   constructor() {
     this.initializeEventListeners();
@@ -62,12 +63,19 @@ class WebSocketService {
     this.updateConnectionStatus('reconnecting');
     this.reconnectAttempts++;
 
+    // Exponential backoff: retry quickly at first, then back off so a
+    // down endpoint isn't hammered on a fixed cadence
+    const delay = Math.min(
+      this.reconnectDelay * 2 ** (this.reconnectAttempts - 1),
+      this.maxReconnectDelay
+    );
+
     setTimeout(() => {
       // Attempt to reconnect logic would go here
       // For now, we'll simulate a successful reconnection
       this.updateConnectionStatus('connected');
       this.reconnectAttempts = 0;
-    }, this.reconnectDelay * this.reconnectAttempts);
+    }, delay);
   }
 
   subscribe(eventType: string, callback: (data: any) => void) {
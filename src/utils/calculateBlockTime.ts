@@ -6,33 +6,22 @@ export function calculateAverageBlockTime(
 ): number | null {
     if (!blocks || blocks.length < 2) return null;
 
-    // Sort blocks by timestamp (oldest first)
-    const sortedBlocks = [...blocks].sort((a, b) => {
-        const timeA =
-            typeof a.timestamp === "string"
-                ? parseInt(a.timestamp)
-                : a.timestamp;
-        const timeB =
+    // Normalize each timestamp to a number once up front, then sort the
+    // plain numbers (oldest first) — the comparator and diff loop below
+    // would otherwise re-parse the same strings over and over
+    const times = blocks
+        .map((b) =>
             typeof b.timestamp === "string"
                 ? parseInt(b.timestamp)
-                : b.timestamp;
-        return timeA - timeB;
-    });
+                : b.timestamp
+        )
+        .sort((a, b) => a - b);
 
     let totalTime = 0;
     let count = 0;
 
-    for (let i = 1; i < sortedBlocks.length; i++) {
-        const currentTime =
-            typeof sortedBlocks[i].timestamp === "string"
-                ? parseInt(sortedBlocks[i].timestamp as string)
-                : (sortedBlocks[i].timestamp as number);
-        const prevTime =
-            typeof sortedBlocks[i - 1].timestamp === "string"
-                ? parseInt(sortedBlocks[i - 1].timestamp as string)
-                : (sortedBlocks[i - 1].timestamp as number);
-
-        const timeDiff = (currentTime - prevTime) / 1000; // Convert to seconds
+    for (let i = 1; i < times.length; i++) {
+        const timeDiff = (times[i] - times[i - 1]) / 1000; // Convert to seconds
 
         // Only count reasonable block times (between 1 and 60 seconds)
         if (timeDiff > 0 && timeDiff < 60) {
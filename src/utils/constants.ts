@@ -3,4 +3,20 @@ export enum AvailableTokens {
     ASI = "ASI",
 }
 
-export const CURRENT_TOKEN = AvailableTokens.ASI;
\ No newline at end of file
+export const CURRENT_TOKEN = AvailableTokens.ASI;
+
+// Polling knobs. Pages declare their own default cadence, but operators can
+// back off every poller at once at build time (e.g. REACT_APP_POLL_INTERVAL_SCALE=4
+// for an instance sitting behind an external monitor instead of a live UI).
+const MIN_POLL_INTERVAL_MS = 1000;
+
+const POLL_INTERVAL_SCALE = (() => {
+    const raw = process.env.REACT_APP_POLL_INTERVAL_SCALE;
+    const parsed = raw ? parseFloat(raw) : NaN;
+    return isNaN(parsed) || parsed <= 0 ? 1 : parsed;
+})();
+
+// Scales a default polling cadence by the configured knob, clamped to a
+// 1-second floor so a bad value can't hammer Hasura with sub-second polls
+export const pollIntervalMs = (defaultMs: number): number =>
+    Math.max(Math.round(defaultMs * POLL_INTERVAL_SCALE), MIN_POLL_INTERVAL_MS);
@@ -13,24 +13,34 @@ export interface GenesisFunding {
   deploy_id: string;
 }
 
+// Look for the match pattern with wallet addresses and amounts
+// Pattern: match [("address1", amount1), ("address2", amount2), ...]
+// Compiled once at module load instead of per call
+const MATCH_REGEX = /match\s*\[\s*(?:\("([^"]+)",\s*(\d+)\)(?:\s*,\s*)?)+\s*\]/g;
+const ENTRY_REGEX = /\("([^"]+)",\s*(\d+)\)/g;
+
 /**
  * Parses the genesis deployment term to extract wallet funding information
  */
 export function parseGenesisFunding(deploymentTerm: string, deployId: string, timestamp: number): GenesisFunding[] {
   const fundings: GenesisFunding[] = [];
-  
+
+  // Cheap substring check before handing the (potentially large) term to
+  // the regex engine; most terms contain no funding table at all
+  if (!deploymentTerm.includes('match')) {
+    return fundings;
+  }
+
   try {
-    // Look for the match pattern with wallet addresses and amounts
-    // Pattern: match [("address1", amount1), ("address2", amount2), ...]
-    const matchRegex = /match\s*\[\s*(?:\("([^"]+)",\s*(\d+)\)(?:\s*,\s*)?)+\s*\]/g;
-    const match = matchRegex.exec(deploymentTerm);
-    
+    MATCH_REGEX.lastIndex = 0;
+    const match = MATCH_REGEX.exec(deploymentTerm);
+
     if (match) {
       // Extract individual wallet funding entries
-      const entryRegex = /\("([^"]+)",\s*(\d+)\)/g;
+      ENTRY_REGEX.lastIndex = 0;
       let entryMatch;
-      
-      while ((entryMatch = entryRegex.exec(deploymentTerm)) !== null) {
+
+      while ((entryMatch = ENTRY_REGEX.exec(deploymentTerm)) !== null) {
         const walletAddress = entryMatch[1];
         const amountDust = parseInt(entryMatch[2]);
         const amountAsi = amountDust / 100000000; // Convert from dust to ASI (8 decimal places)